@@ -4,16 +4,17 @@ A build script which can be used to compile animations and build the website.
 Fuzzy matching is used to enable quickly specifying targets in the website folder.
 """
 
-import inspect
 import os
 import subprocess
 import argparse
 import sys
 import pathlib
 import importlib
-import re
+import string
+import functools
+import concurrent.futures
 
-from thefuzz import process, fuzz
+from rapidfuzz import process, fuzz, utils
 
 # prevent manim from printing
 sys.stdout = open(os.devnull, "w")
@@ -28,27 +29,48 @@ quality_folder_lookup = {"l": "480p15", "m": "720p30", "h": "1080p60"}
 
 exclude_folders = ["__pycache__", "media", "_style"]
 
-split_regex = "A-Z_/\\\\"
+split_characters = frozenset(string.ascii_uppercase + "_/\\")
 
+# scores below the cutoff are skipped by rapidfuzz; abbreviations typically score 35-40
+score_cutoff = 30
 
-def get_all_file_paths(base: pathlib.Path) -> list[pathlib.Path]:
-    """Searches source_path for all potential files. Returns a mapping of file names to their paths."""
+
+def walk_source() -> tuple[list[pathlib.Path], list[pathlib.Path]]:
+    """Walks source_path once, returning all folders and all potential files.
+
+    Folders in exclude_folders are pruned, so their contents are never visited.
+    """
+    folders: list[pathlib.Path] = []
+    file_paths: list[pathlib.Path] = []
+    for root, dirs, files in os.walk(source_path):
+        dirs[:] = [folder for folder in dirs if folder not in exclude_folders]
+        root_path = pathlib.Path(root)
+        folders.append(root_path)
+        file_paths.extend(
+            root_path / file
+            for file in files
+            if file.endswith(".py") and file != "conf.py"
+        )
+    return folders, file_paths
+
+
+def get_all_file_paths(
+    file_paths: list[pathlib.Path], bases: list[pathlib.Path]
+) -> list[pathlib.Path]:
+    """Filters file_paths down to the files contained in any of bases."""
     return [
-        file_path for file_path in base.glob("**/*.py") if file_path.name != "conf.py"
+        file_path
+        for file_path in file_paths
+        if any(file_path.is_relative_to(base) for base in bases)
     ]
 
 
-def get_all_paths() -> list[pathlib.Path]:
-    """Searches source_path for all possible paths, including sub-paths, and returns them.
+def get_all_paths(folders: list[pathlib.Path]) -> list[pathlib.Path]:
+    """Converts folders found in source_path to paths relative to source_path.
 
     This function is used to collect paths for matching with the -p option.
-    The paths include paths to all files.
     """
-    return [
-        pathlib.Path(*path.parts[1:])
-        for path in source_path.glob("**")
-        if path.name not in exclude_folders
-    ]
+    return [pathlib.Path(*path.parts[1:]) for path in folders]
 
 
 def get_all_scenes(file_paths: list[pathlib.Path]) -> dict[str, pathlib.Path]:
@@ -66,21 +88,75 @@ def get_all_scenes(file_paths: list[pathlib.Path]) -> dict[str, pathlib.Path]:
     )
 
 
+@functools.lru_cache(maxsize=None)
 def get_scene_names(file_path: pathlib.Path) -> list[str]:
-    """Extracts a list of scene names from the file specified by file_path."""
-    module_path = str(file_path).replace("/", ".").removesuffix(".py")
-    module = importlib.import_module(module_path)
-    return [
-        name
-        for name, cls in inspect.getmembers(module)
-        if inspect.isclass(cls)
-        and issubclass(cls, mn.Scene)
-        and cls.__module__ == module_path
+    """Extracts a list of scene names from the file specified by file_path.
+
+    Results are cached, so each file is only imported and scanned once.
+    """
+    # use parts rather than replacing "/" so Windows separators are handled too
+    module_path = ".".join(file_path.with_suffix("").parts)
+    if module_path not in sys.modules:
+        importlib.import_module(module_path)
+    # walk the Scene hierarchy rather than every name the module pulled in from manim
+    # sorted by name, matching the order inspect.getmembers used to return
+    return sorted(
+        cls.__name__
+        for cls in get_all_subclasses(mn.Scene)
+        if cls.__module__ == module_path and cls.__qualname__ == cls.__name__
+    )
+
+
+def get_all_subclasses(cls: type) -> list[type]:
+    """Returns every direct and indirect subclass of cls.
+
+    Not cached, since importing a module may add new subclasses.
+    """
+    subclasses: dict[type, None] = {}
+    stack = cls.__subclasses__()
+    while stack:
+        subclass = stack.pop()
+        if subclass not in subclasses:
+            subclasses[subclass] = None
+            stack.extend(subclass.__subclasses__())
+    return list(subclasses)
+
+
+def render_scenes(
+    quality: str, file_path: pathlib.Path, scene_names: list[str]
+) -> None:
+    """Renders scenes from a single file using one manim invocation and moves the results into website."""
+    # files are rendered concurrently, so each gets its own media folder;
+    # manim's Text and Tex caches are not safe to share between processes
+    media_dir = get_media_dir(file_path)
+    # pass arguments directly so no shell is spawned per invocation
+    manim_command = [
+        "manim",
+        "render",
+        "-v",
+        "ERROR",
+        "-q{}".format(quality),
+        "--media_dir",
+        str(media_dir),
+        str(file_path),
+        *scene_names,
     ]
 
+    print("Rendering {} - {}".format(file_path, ", ".join(scene_names)))
+    subprocess.run(manim_command)
+    for scene_name in scene_names:
+        move_output(quality, media_dir, file_path, scene_name)
+
+
+def get_media_dir(file_path: pathlib.Path) -> pathlib.Path:
+    """Returns the media folder manim renders file_path into."""
+    return pathlib.Path("media", "_".join(file_path.with_suffix("").parts))
 
-def move_output(quality: str, file_path: pathlib.Path, scene_name: str) -> None:
-    """Moves produced files from media to the appropriate location in website."""
+
+def move_output(
+    quality: str, media_dir: pathlib.Path, file_path: pathlib.Path, scene_name: str
+) -> None:
+    """Moves produced files from media_dir to the appropriate location in website."""
     quality_folder = quality_folder_lookup[quality]
 
     path, sub_folder = os.path.split(file_path)
@@ -89,7 +165,8 @@ def move_output(quality: str, file_path: pathlib.Path, scene_name: str) -> None:
     subprocess.run("mkdir -p {}/media".format(path), shell=True)
 
     # for scene in scenes:
-    move_command = "mv media/videos/{sub_folder}/{quality_folder}/{scene_name}.mp4 {path}/media/.".format(
+    move_command = "mv {media_dir}/videos/{sub_folder}/{quality_folder}/{scene_name}.mp4 {path}/media/.".format(
+        media_dir=media_dir,
         sub_folder=sub_folder.removesuffix(".py"),
         scene_name=scene_name,
         quality_folder=quality_folder,
@@ -150,31 +227,75 @@ def get_arg_parser() -> argparse.ArgumentParser:
 
 
 def fuzzy_search(targets: list[str], values: list[str]) -> list[str]:
-    parsed_targets = dict([(target, split_tokens(target)) for target in targets])
+    matches: list[str | None] = [exact_search(targets, value) for value in values]
+    fuzzy_indices = [i for i, match in enumerate(matches) if match is None]
+    if not fuzzy_indices:
+        return [match for match in matches if match is not None]
+
+    parsed_targets = [split_tokens(target) for target in targets]
+    parsed_values = [split_tokens(values[i]) for i in fuzzy_indices]
+
+    # score every value against every target in a single batched call
+    # thefuzz lower-cased and stripped inputs by default; rapidfuzz requires an explicit processor
+    scores = process.cdist(
+        parsed_values,
+        parsed_targets,
+        scorer=fuzz.token_sort_ratio,
+        processor=utils.default_process,
+        score_cutoff=score_cutoff,
+        workers=-1,
+    )
 
-    matches = []
-    for value in values:
-        parsed_value = split_tokens(value)
-        _, score, target_name = process.extractOne(  # type: ignore
-            parsed_value, parsed_targets, scorer=fuzz.token_sort_ratio  # type: ignore
-        )
+    for parsed_value, i, row in zip(parsed_values, fuzzy_indices, scores):
+        best = int(row.argmax())
+        score = row[best]
+        if score == 0:
+            # every target fell below the cutoff, so rescore this value without one
+            _, score, best = process.extractOne(  # type: ignore
+                parsed_value,
+                parsed_targets,
+                scorer=fuzz.token_sort_ratio,
+                processor=utils.default_process,
+            )
+        target_name = targets[best]
 
         if score < 95:
-            print("Found {} for input {} (score: {})".format(target_name, value, score))
+            # cdist returns float scores; print them as whole numbers like thefuzz did
+            print(
+                "Found {} for input {} (score: {:.0f})".format(
+                    target_name, values[i], score
+                )
+            )
         # print("Inputs:", parsed_targets)
-        # print("Query:", parsed_value)
-        matches.append(target_name)
-    return matches
+        # print("Scores:", row)
+        matches[i] = target_name
+    return [match for match in matches if match is not None]
+
+
+def exact_search(targets: list[str], value: str) -> str | None:
+    """Returns value if it is a target, or the sole target starting with value.
+
+    Returns None when value is ambiguous and must be fuzzy matched instead.
+    """
+    if value in targets:
+        return value
+    prefix_matches = [target for target in targets if target.startswith(value)]
+    return prefix_matches[0] if len(prefix_matches) == 1 else None
 
 
+@functools.lru_cache(maxsize=None)
 def split_tokens(input: str) -> str:
-    parsed = re.search("[^{}]*".format(split_regex), input)
-    matches: list[str] = []
-    if parsed is not None:
-        matches.append(parsed.group(0))
+    """Splits input into space separated tokens.
 
-    end = re.findall("[{}][^{}]*".format(split_regex, split_regex), input)
-    matches.extend(end)
+    A new token is started at every character in split_characters. The leading token may be empty.
+    """
+    matches: list[str] = []
+    start = 0
+    for i, char in enumerate(input):
+        if char in split_characters:
+            matches.append(input[start:i])
+            start = i
+    matches.append(input[start:])
     return " ".join(matches)
 
 
@@ -183,18 +304,19 @@ def main():
 
     quality = "m" if args.production else "l"
 
+    folders, all_file_paths = walk_source()
+
     target_paths = []
     if args.path is not None:
-        all_paths = get_all_paths()
+        all_paths = get_all_paths(folders)
         all_path_strs = [str(path) for path in all_paths]
         results = fuzzy_search(all_path_strs, args.path)
-        file_path_lists = [
-            get_all_file_paths(source_path / pathlib.Path(path)) for path in results
-        ]
-        target_paths = [item for sublist in file_path_lists for item in sublist]
+        target_paths = get_all_file_paths(
+            all_file_paths, [source_path / pathlib.Path(path) for path in results]
+        )
 
     else:
-        target_paths = get_all_file_paths(source_path)
+        target_paths = all_file_paths
 
     if args.file is not None:
         # we use a dict so we can split names into sequences
@@ -207,18 +329,19 @@ def main():
         results = fuzzy_search(list(scenes.keys()), args.scene)
         scenes = dict([(k, v) for k, v in scenes.items() if k in results])
 
+    # group scenes by file so each file only pays for manim's startup once
+    scenes_by_file: dict[pathlib.Path, list[str]] = {}
     for scene_name, file_path in scenes.items():
-        manim_command = (
-            "manim render -v ERROR -q{quality} {file_path} {scene_names}".format(
-                quality=quality,
-                file_path=file_path,
-                scene_names=scene_name,  # " ".join(scene_names),
-            )
-        )
+        scenes_by_file.setdefault(file_path, []).append(scene_name)
 
-        print("Rendering {} - {}".format(file_path, scene_name))
-        subprocess.run(manim_command, shell=True)
-        move_output(quality, file_path, scene_name)
+    # files share no state, so they may be rendered concurrently
+    with concurrent.futures.ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        futures = [
+            executor.submit(render_scenes, quality, file_path, scene_names)
+            for file_path, scene_names in scenes_by_file.items()
+        ]
+        for future in concurrent.futures.as_completed(futures):
+            future.result()
 
     if args.make:
         subprocess.run("make html", shell=True)
@@ -6,6 +6,9 @@ from library.design import sketch, sketch_animation
 from library.math import vector, tangent
 from library.utils.type_utils import not_none
 
+# indexed by Tangent's reverse flag
+_ROTATION_SIGN: tuple[int, int] = (1, -1)
+
 
 class ConstraintBase(mn.Succession):
     def __init__(self, animation: mn.Animation | Any, *mobjects: sketch.Base) -> None:
@@ -58,22 +61,25 @@ class Tangent(ConstraintBase):
             start = base.is_start_closer_to_target(target)
             close, far = (base.start, base.end) if start else (base.end, base.start)
             close_point, far_point = close.get_center(), far.get_center()
+            # get_center walks the target's points, so only compute it once
+            center, radius = target.get_center(), target.get_radius()
 
             if reverse:
                 tangent_point = tangent.point_to_circle_tangent(
-                    far_point, target.get_center(), target.get_radius()
+                    far_point, center, radius
                 )
             else:
                 tangent_point = tangent.circle_to_point_tangent(
-                    target.get_center(), target.get_radius(), far_point
+                    center, radius, far_point
                 )
 
-            angle = vector.angle_between_points(
-                close_point, tangent_point, target.get_center()
-            ) * (-1 if reverse else 1)
+            angle = (
+                vector.angle_between_points(close_point, tangent_point, center)
+                * _ROTATION_SIGN[reverse]
+            )
 
             animation = close.animate(
-                path_arc=angle, path_arg_centers=[target.get_center()]
+                path_arc=angle, path_arg_centers=[center]
             ).move_to(tangent_point)
 
         super().__init__(animation, base, target)
@@ -1,4 +1,8 @@
+from __future__ import annotations
+
+import functools
 import manim as mn
+import numpy as np
 from typing import Callable, Self
 
 from library.style import color
@@ -13,10 +17,7 @@ class PlateCircle(sketch.Circle):
         self.outside = outer_circle
         super().__init__(self.outside)
 
-        def follow(mobject: mn.Mobject) -> None:
-            mobject.move_to(self.get_center())
-
-        self.inside.add_updater(follow, call_updater=True)
+        self.inside.add_updater(_inside_updater, call_updater=True)
 
     def get_inner_radius(self) -> float:
         return self.inside.radius
@@ -27,23 +28,64 @@ class PlateCircle(sketch.Circle):
     def get_group(self) -> mn.VGroup:
         return mn.VGroup(self.inside, super().get_group())
 
+    def _bind_updaters(self) -> None:
+        super()._bind_updaters()
+        self.inside._sketch_owner = sketch.Owner(self)  # type: ignore
+
     def click_target(self) -> mn.VMobject:
         return self.outside
 
 
+def _inside_updater(mobject: mn.Mobject) -> None:
+    owner: PlateCircle = mobject._sketch_owner.entity  # type: ignore
+    mobject.move_to(owner.get_center())
+
+
 def plate_circle_tangent_points(
     start: PlateCircle, end: PlateCircle
 ) -> tuple[vector.Point2d, vector.Point2d]:
-    return tangent.circle_to_circle_tangent(
-        start.get_center(),
+    points = _cached_circle_tangent(*_tangent_key(start, end))
+    # copy so callers cannot modify cached results
+    return points[0].copy(), points[1].copy()
+
+
+def _tangent_key(
+    start: PlateCircle, end: PlateCircle
+) -> tuple[tuple[float, ...], float, tuple[float, ...], float]:
+    # circles may move, so results are cached by geometry rather than by circle
+    return (
+        tuple(start.get_center()),
         start.get_outer_radius(),
-        end.get_center(),
+        tuple(end.get_center()),
         end.get_outer_radius(),
     )
 
 
+@functools.lru_cache(maxsize=None)
+def _cached_circle_tangent(
+    center1: tuple[float, ...],
+    radius1: float,
+    center2: tuple[float, ...],
+    radius2: float,
+) -> tuple[vector.Point2d, vector.Point2d]:
+    return tangent.circle_to_circle_tangent(
+        np.array(center1), radius1, np.array(center2), radius2
+    )
+
+
 def plate_circle_tangent_line(start: PlateCircle, end: PlateCircle) -> sketch.Line:
-    return sketch.make_line(*plate_circle_tangent_points(start, end))
+    # copy the cached template so each caller gets its own mobjects
+    return _cached_tangent_line(*_tangent_key(start, end)).copy()
+
+
+@functools.lru_cache(maxsize=64)
+def _cached_tangent_line(
+    center1: tuple[float, ...],
+    radius1: float,
+    center2: tuple[float, ...],
+    radius2: float,
+) -> sketch.Line:
+    return sketch.make_line(*_cached_circle_tangent(center1, radius1, center2, radius2))
 
 
 PlateCircleGenerator = Callable[[vector.Point2d], PlateCircle]
@@ -53,6 +95,7 @@ class PlateCircleFactory:
     def __init__(self) -> None:
         self._inner_color: color.Color = color.FOREGROUND
         self._outer_color: color.Color = color.FOREGROUND
+        self._generators: dict[tuple[float, float], PlateCircleGenerator] = {}
 
     def set_inner_color(self, color: color.Color) -> Self:
         self._inner_color = color
@@ -67,14 +110,20 @@ class PlateCircleFactory:
         Returns a generator function which may be used to create points of the given size.
         The generator function takes a location as an argument.
         """
-
-        def generator(point: vector.Point2d) -> PlateCircle:
-            return PlateCircle(
-                mn.Circle(radius, color=self._inner_color, arc_center=point),
-                mn.Circle(radius + offset, color=self._outer_color, arc_center=point),
-            )
-
-        return generator
+        # generators read colors when called, so one per size can be shared
+        key = (radius, offset)
+        if key not in self._generators:
+
+            def generator(point: vector.Point2d) -> PlateCircle:
+                return PlateCircle(
+                    mn.Circle(radius, color=self._inner_color, arc_center=point),
+                    mn.Circle(
+                        radius + offset, color=self._outer_color, arc_center=point
+                    ),
+                )
+
+            self._generators[key] = generator
+        return self._generators[key]
 
     def make(
         self, radius: float, offset: float, location: vector.Point2d
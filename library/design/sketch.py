@@ -49,21 +49,31 @@ class Base(mn.VMobject, ABC):
     def click_target(self) -> mn.VMobject:
         raise NotImplementedError
 
+    def _bind_updaters(self) -> None:
+        """Points the shared updaters of the entity's mobjects at this entity."""
 
-class Point(mn.Dot, Base):
-    """Defines a singlar Sketch vertex."""
-
-    def __init__(self, dot: mn.Dot) -> None:
-        super().__init__()
-        self.become(dot)
+    def __deepcopy__(self, memo: dict[int, Any]) -> Self:
+        # owner references are not copied, so a copied entity must claim its own mobjects
+        result = super().__deepcopy__(memo)
+        result._bind_updaters()
+        return result
 
-    def follow(self, point_function: Callable[[], vector.Point2d]) -> Self:
-        """Adds an updater function which causes this point to track the specified input."""
 
-        def updater(mobject: mn.Mobject):
-            mobject.move_to(point_function())
+class Point(mn.Dot, Base):
+    """Defines a singlar Sketch vertex."""
 
-        self.add_updater(updater, call_updater=True)
+    def __init__(
+        self, point: vector.Point2d = mn.ORIGIN, color: color.Color = SketchState.NORMAL
+    ) -> None:
+        super().__init__(point, color=color)
+
+    def follow(
+        self, owner: mn.Mobject, point_function: Callable[[Any], vector.Point2d]
+    ) -> Self:
+        """Adds an updater function which causes this point to track point_function(owner)."""
+        self._point_function = point_function
+        self._sketch_owner = Owner(owner)
+        self.add_updater(_follow_updater, call_updater=True)
         return self
 
     def get_group(self) -> mn.VGroup:
@@ -109,10 +119,8 @@ class Line(mn.VGroup, Base):
         self.end = _make_point(point=self.line.get_end())
         super().__init__(self.start, self.end)
 
-        def updater(mobject: mn.Mobject) -> None:
-            mobject.put_start_and_end_on(self.start.get_center(), self.end.get_center())
-
-        self.line.add_updater(updater)
+        self._bind_updaters()
+        self.line.add_updater(_line_updater)
 
     @override
     def get_group(self) -> mn.VGroup:
@@ -131,10 +139,10 @@ class Line(mn.VGroup, Base):
         return self.line.get_midpoint()
 
     def get_length(self) -> float:
-        return vector.norm(self.get_end() - self.get_start())
+        return vector.norm_and_normalize(self.get_end() - self.get_start())[0]
 
     def get_direction(self) -> vector.Direction2d:
-        return vector.normalize(self.get_end() - self.get_start())
+        return vector.norm_and_normalize(self.get_end() - self.get_start())[1]
 
     def move_start(self, point: vector.Point2d) -> Self:
         self.start.move_to(point)
@@ -144,6 +152,10 @@ class Line(mn.VGroup, Base):
         self.end.move_to(point)
         return self
 
+    @override
+    def _bind_updaters(self) -> None:
+        self.line._sketch_owner = Owner(self)  # type: ignore
+
     @override
     def click_target(self) -> mn.VMobject:
         return self.line
@@ -172,17 +184,17 @@ class Line(mn.VGroup, Base):
 
     def get_tangent_translation(self, target: ArcBase) -> vector.Vector2d:
         projection: vector.Point2d = self.line.get_projection(target.get_center())  # type: ignore
-        return vector.direction(projection, target.get_center()) * (
-            vector.norm(target.get_center() - projection) - target.get_radius()
-        )
+        length, direction = vector.norm_and_normalize(target.get_center() - projection)
+        return direction * (length - target.get_radius())
 
     def is_start_closer_to_target(self, target: ArcBase) -> bool:
         """Returns whether the start is closer than the end to target.
 
         Used by tangent's rotate mode.
         """
-        return vector.norm(self.get_start() - target.get_center()) < vector.norm(
-            self.get_end() - target.get_center()
+        center = target.get_center()
+        return vector.norm(self.get_start() - center) < vector.norm(
+            self.get_end() - center
         )
 
     @override
@@ -238,14 +250,18 @@ class ArcBase(mn.VGroup, Base, ABC):
         self.arc.radius = radius
         return not_none(animation)
 
+    @override
+    def _bind_updaters(self) -> None:
+        self.arc._sketch_owner = Owner(self)  # type: ignore
+
     @override
     def click_target(self) -> mn.VMobject:
         return self.arc
 
     def coincident_target(self, point: vector.Point2d) -> vector.Point2d:
-        return self.get_center() + (
-            vector.direction(self.get_center(), point) * self.get_radius()
-        )
+        # a zero length offset normalizes to zero, which leaves the target at center
+        center = self.get_center()
+        return center + vector.normalize(point - center) * self.get_radius()
 
     def concentric_target(self) -> vector.Point2d:
         return self.middle.get_center()
@@ -255,10 +271,10 @@ class ArcBase(mn.VGroup, Base, ABC):
     #     return self.middle.animate().shift(translation)
 
     def get_tangent_translation(self, target: ArcBase) -> vector.Vector2d:
-        vec = target.get_center() - self.get_center()
-        return vector.normalize(vec) * (
-            vector.norm(vec) - self.get_radius() - target.get_radius()
+        length, direction = vector.norm_and_normalize(
+            target.get_center() - self.get_center()
         )
+        return direction * (length - self.get_radius() - target.get_radius())
 
 
 class Circle(ArcBase):
@@ -268,10 +284,8 @@ class Circle(ArcBase):
         self.circle = circle
         super().__init__(self.circle)
 
-        def updater(mobject: mn.Mobject) -> None:
-            mobject.move_to(self.middle.get_center())
-
-        self.arc.add_updater(updater)
+        self._bind_updaters()
+        self.arc.add_updater(_circle_updater)
 
     @override
     def get_group(self) -> mn.VGroup:
@@ -301,21 +315,23 @@ class Arc(ArcBase):
 
     def __init__(self, arc: mn.Arc) -> None:
         self.arc = arc
-        self.start = _make_point().follow(self.arc.get_start)
-        self.end = _make_point().follow(self.arc.get_end)
+        self.start = _make_point().follow(self, _arc_start)
+        self.end = _make_point().follow(self, _arc_end)
         super().__init__(self.arc)
 
-        def updater(mobject: mn.Mobject) -> None:
-            mobject.move_arc_center_to(self.middle.get_center())
-            self.start.update()
-            self.end.update()
-
-        self.arc.add_updater(updater)
+        self._bind_updaters()
+        self.arc.add_updater(_arc_updater)
 
     @override
     def get_group(self) -> mn.VGroup:
         return mn.VGroup(self.arc, self.start, self.end, self.middle)
 
+    @override
+    def _bind_updaters(self) -> None:
+        super()._bind_updaters()
+        self.start._sketch_owner = Owner(self)
+        self.end._sketch_owner = Owner(self)
+
     @mn.override_animation(mn.Create)
     def _create_override(self) -> mn.Animation:
         return not_none(
@@ -335,8 +351,61 @@ class Arc(ArcBase):
         )
 
 
+# Updaters are shared module level functions rather than per-entity closures.
+# Each updated mobject stores its owning entity in _sketch_owner, and the updater resolves
+# everything else it reads through that entity.
+
+
+class Owner:
+    """Refers to the entity which owns a mobject.
+
+    Copying a mobject shares its Owner rather than copying the entity along with it.
+    Entities rebind their mobjects to themselves when copied (see Base._bind_updaters).
+    """
+
+    __slots__ = ("entity",)
+
+    def __init__(self, entity: Any) -> None:
+        self.entity = entity
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> Owner:
+        return self
+
+
+def _follow_updater(mobject: mn.Mobject) -> None:
+    point: Point = mobject  # type: ignore
+    point.move_to(point._point_function(point._sketch_owner.entity))
+
+
+def _line_updater(mobject: mn.Mobject) -> None:
+    line: mn.Line = mobject  # type: ignore
+    owner: Line = line._sketch_owner.entity  # type: ignore
+    line.put_start_and_end_on(owner.get_start(), owner.get_end())
+
+
+def _circle_updater(mobject: mn.Mobject) -> None:
+    owner: Circle = mobject._sketch_owner.entity  # type: ignore
+    mobject.move_to(owner.middle.get_center())
+
+
+def _arc_updater(mobject: mn.Mobject) -> None:
+    arc: mn.Arc = mobject  # type: ignore
+    owner: Arc = arc._sketch_owner.entity  # type: ignore
+    arc.move_arc_center_to(owner.middle.get_center())
+    owner.start.update()
+    owner.end.update()
+
+
+def _arc_start(arc: Arc) -> vector.Point2d:
+    return arc.arc.get_start()
+
+
+def _arc_end(arc: Arc) -> vector.Point2d:
+    return arc.arc.get_end()
+
+
 def _make_point(point: vector.Point2d = mn.ORIGIN) -> Point:
-    return Point(mn.Dot(point, color=SketchState.NORMAL))
+    return Point(point, color=SketchState.NORMAL)
 
 
 def make_line(start_point: vector.Point2d, end_point: vector.Point2d) -> Line:
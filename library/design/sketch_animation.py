@@ -1,11 +1,18 @@
 from typing import cast
+import itertools
+import weakref
+
 import manim as mn
 from library.design import sketch
 from library.style import color
 
-
 # doesn't work as a class member...
-Z_INDEX = 500
+_z_index_counter = itertools.count(500)
+
+
+def next_z_index() -> int:
+    """Returns a z_index above every previously returned z_index."""
+    return next(_z_index_counter)
 
 
 class Click(mn.Transform):
@@ -13,18 +20,41 @@ class Click(mn.Transform):
 
     def __init__(self, mobject: sketch.Base):
         base = mobject.click_target()
-        target = base.copy().set_stroke(width=4 * 3.5).set_color(color.Palette.YELLOW)  # type: ignore
+        target = _highlight_target(base)
 
         # set z_index to make highlight go over the top (a bit suss)
-        global Z_INDEX
-        base.set_z_index(Z_INDEX)
-        Z_INDEX += 1
+        base.set_z_index(next_z_index())
 
         super().__init__(
             base, target_mobject=target, rate_func=mn.there_and_back, run_time=0.75
         )
 
 
+# Clicks of identical mobjects share one highlight target.
+# Transform runs its target's updaters every frame, and a copied target keeps the owner of
+# the mobject it was copied from, so the owner is part of the key.
+# The cached target holds that owner, so its id cannot be reused while the entry exists.
+_highlight_cache: weakref.WeakValueDictionary[tuple, mn.VMobject] = (
+    weakref.WeakValueDictionary()
+)
+
+
+def _highlight_target(base: mn.VMobject) -> mn.VMobject:
+    """Returns a highlighted copy of base, reusing a previous copy of an identical mobject if possible."""
+    key = (
+        type(base),
+        id(getattr(base, "_sketch_owner", None)),
+        b"".join(member.points.tobytes() for member in base.get_family()),  # type: ignore
+        base.get_fill_opacity(),
+        base.get_stroke_opacity(),
+    )
+    target = _highlight_cache.get(key)
+    if target is None:
+        target = base.copy().set_stroke(width=4 * 3.5).set_color(color.Palette.YELLOW)  # type: ignore
+        _highlight_cache[key] = target
+    return target
+
+
 def make(animation: mn.Animation, *mobjects: sketch.Base) -> mn.Succession:
     """Defines a step in an animation.
 
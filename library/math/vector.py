@@ -1,9 +1,9 @@
 """
     A collection of semantic aliases for type hinting used throughout the library.
 """
-from typing import cast, TypeAlias, Any
+from typing import TypeAlias, Any
+import math
 
-import manim as mn
 import numpy as np
 
 Vector: TypeAlias = Any
@@ -24,15 +24,32 @@ Direction2d: TypeAlias = Any
 Angle = float
 
 
+# Vectors are always 3 elements long, so the helpers below use scalar arithmetic;
+# numpy's per-call overhead dominates the actual math for arrays this small.
+
+
 def norm(vector: Point | Vector) -> float:
     """
     Returns the norm (length) of a vector.
     """
-    return cast(float, np.linalg.norm(vector))
+    return math.hypot(vector[0], vector[1], vector[2])
 
 
 def normalize(vector: Vector) -> Direction:
-    return mn.normalize(vector)
+    return norm_and_normalize(vector)[1]
+
+
+def norm_and_normalize(vector: Vector) -> tuple[float, Direction]:
+    """
+    Returns the norm (length) of a vector along with its normalized direction.
+    Cheaper than calling norm and normalize separately on the same vector.
+    """
+    length = norm(vector)
+    if length == 0:
+        return 0.0, np.zeros(3)
+    return length, np.array(
+        (vector[0] / length, vector[1] / length, vector[2] / length)
+    )
 
 
 def dot(vector1: Vector, vector2: Vector) -> Vector:
@@ -41,7 +58,7 @@ def dot(vector1: Vector, vector2: Vector) -> Vector:
 
 def vector_2d(x: float, y: float) -> Vector2d:
     """A constructor for a vector2d."""
-    return np.array([x, y, 0])
+    return np.array([x, y, 0.0])
 
 
 # def vector_3d(x: float, y: float, z: float) -> Vector3d:
@@ -51,7 +68,7 @@ def vector_2d(x: float, y: float) -> Vector2d:
 
 def point_2d(x: float, y: float) -> Point2d:
     """A constructor for a 2D point."""
-    return np.array([x, y, 0])
+    return np.array([x, y, 0.0])
 
 
 # def point_3d(x: float, y: float, z: float) -> Point3d:
@@ -65,7 +82,7 @@ def direction(from_point: Point, to_point: Point) -> Direction:
 
 def direction_2d(x: float, y: float) -> Direction2d:
     """A constructor for a 2D direction."""
-    return normalize(np.array([x, y, 0]))
+    return normalize(np.array([x, y, 0.0]))
 
 
 # def direction_3d(x: float, y: float, z: float) -> Direction3d:
@@ -74,11 +91,29 @@ def direction_2d(x: float, y: float) -> Direction2d:
 
 
 def angle_between_vectors(x1: Vector, x2: Vector) -> Angle:
-    return mn.angle_between_vectors(x1, x2)
+    """
+    Returns the (unsigned) angle between two vectors.
+    Uses the same formula as manim's angle_between_vectors.
+    """
+    a0, a1, a2 = _unit_components(x1)
+    b0, b1, b2 = _unit_components(x2)
+    return 2 * math.atan2(
+        math.hypot(a0 - b0, a1 - b1, a2 - b2), math.hypot(a0 + b0, a1 + b1, a2 + b2)
+    )
 
 
 def angle_between_points(start: Point, end: Point, center: Point) -> Angle:
-    return angle_between_vectors(start - center, end - center)
+    return angle_between_vectors(
+        (start[0] - center[0], start[1] - center[1], start[2] - center[2]),
+        (end[0] - center[0], end[1] - center[1], end[2] - center[2]),
+    )
+
+
+def _unit_components(vector: Vector) -> tuple[float, float, float]:
+    length = norm(vector)
+    if length == 0:
+        return 0.0, 0.0, 0.0
+    return vector[0] / length, vector[1] / length, vector[2] / length
 
 
 ZERO_LENGTH: float = 0.00001
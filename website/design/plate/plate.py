@@ -1,5 +1,9 @@
 """Animations which model basic plates."""
+
+from __future__ import annotations
+
 import manim as mn
+import numpy as np
 from library.style import color, animation
 from library.math import vector
 from library.utils import title_sequence
@@ -11,9 +15,25 @@ boundary_color: color.Color = color.Palette.BLUE
 plate_factory: plate.PlateCircleFactory = plate.PlateCircleFactory()
 plate_factory.set_inner_color(inner_color).set_outer_color(boundary_color)
 
-title: title_sequence.TitleSequence = title_sequence.TitleSequence(
-    default_color=boundary_color
-)
+
+def _intake_centers() -> np.ndarray:
+    # front, middle, and back holes
+    holes = np.array(
+        [
+            vector.point_2d(-4, -3),
+            vector.point_2d(-1.5, 0.25),
+            vector.point_2d(2.5, 1.5),
+        ]
+    )
+    offsets = np.array([vector.vector_2d(0.8, 0.75), vector.vector_2d(1, -0.2)])
+    return np.vstack(
+        [
+            holes,
+            holes[[2, 2]] + offsets,
+            # midpoints of middle and back, then front and middle
+            (holes[[1, 0]] + holes[[2, 1]]) / 2,
+        ]
+    )
 
 
 class IntakePlateScene(mn.Scene):
@@ -21,34 +41,27 @@ class IntakePlateScene(mn.Scene):
         small_base: plate.PlateCircleGenerator = plate_factory.make_generator(0.15, 0.2)
         medium_base: plate.PlateCircleGenerator = plate_factory.make_generator(0.4, 0.2)
 
-        front_hole = vector.point_2d(-4, -3)
-        middle_hole = vector.point_2d(-1.5, 0.25)
-        back_hole = vector.point_2d(2.5, 1.5)
-
+        centers = _intake_centers()
         points: list[plate.PlateCircle] = [
-            medium_base(front_hole),
-            medium_base(middle_hole),
-            medium_base(back_hole),
-            small_base(back_hole + vector.vector_2d(0.8, 0.75)),
-            small_base(back_hole + vector.vector_2d(1, -0.2)),
-            small_base((middle_hole + back_hole) / 2),
-            small_base((front_hole + middle_hole) / 2),
-        ]
+            medium_base(center) for center in centers[:3]
+        ] + [small_base(center) for center in centers[3:]]
         boundary_order: list[int] = [1, 3, 4, 0]
         self._plate_group: plate.PlateGroup = plate.PlateGroup(points, boundary_order)
-        title.reset()
+        self._title: title_sequence.TitleSequence = title_sequence.TitleSequence(
+            default_color=boundary_color
+        )
 
     def construct(self):
-        self.play(title.next("Draw plate holes", color=inner_color))
+        self.play(self._title.next("Draw plate holes", color=inner_color))
         self.play(self._plate_group.draw_inner_circles())
 
-        self.play(title.next("Add larger circles"))
+        self.play(self._title.next("Add larger circles"))
         self.play(self._plate_group.draw_outer_circles())
 
-        self.play(title.next("Connect boundary"))
+        self.play(self._title.next("Connect boundary"))
         self.play(self._plate_group.draw_boundary())
 
-        # self.play(title.next("Trim", color=boundary_color))
+        # self.play(self._title.next("Trim", color=boundary_color))
         # self.play(plate_group.trim(), run_time=5)
 
         self.wait(animation.END_DELAY)
@@ -72,17 +85,20 @@ class BoundaryRedrawScene(mn.Scene):
             self._right.get_group(),
             self._line.get_group(),
         )
-        title.reset()
+        self._title: title_sequence.TitleSequence = title_sequence.TitleSequence(
+            default_color=boundary_color
+        )
 
     def construct(self):
-        self.play(title.next("Add outer circle"))
+        self.play(self._title.next("Add outer circle"))
         self.play(mn.GrowFromCenter(self._middle.outside))
 
-        self.play(title.next("Redraw boundary"))
+        self.play(self._title.next("Redraw boundary"))
         self.play(mn.Uncreate(self._line))
         self.wait(0.5)
-        self.play(mn.Create(plate.plate_circle_tangent_line(self._left, self._middle)))
-        self.play(mn.Create(plate.plate_circle_tangent_line(self._middle, self._right)))
+        left_line = plate.plate_circle_tangent_line(self._left, self._middle)
+        right_line = plate.plate_circle_tangent_line(self._middle, self._right)
+        self.play(mn.Succession(mn.Create(left_line), mn.Create(right_line)))
 
         self.wait(animation.END_DELAY)
 
@@ -98,21 +114,24 @@ class BoundaryConstraintScene(mn.Scene):
             vector.Point2d, vector.Point2d
         ] = plate.plate_circle_tangent_points(self._left, self._right)
 
-        left_start_point = self._tangent_points[0] + vector.point_2d(1.75, 0.75)
-        right_start_point = self._tangent_points[1] + vector.point_2d(-2, 0.5)
+        # offset the left and right ends away from their tangent points
+        offsets = np.array([vector.vector_2d(1.75, 0.75), vector.vector_2d(-2, 0.5)])
+        start_points = np.array(self._tangent_points) + offsets
 
-        self._line: sketch.Line = sketch.make_line(left_start_point, right_start_point)
-        title.reset()
+        self._line: sketch.Line = sketch.make_line(*start_points)
+        self._title: title_sequence.TitleSequence = title_sequence.TitleSequence(
+            default_color=boundary_color
+        )
 
     def construct(self):
-        self.play(title.next("Create line"))
+        self.play(self._title.next("Create line"))
         self.play(mn.Create(self._line))
 
-        self.play(title.next("Add coincident constraints"))
+        self.play(self._title.next("Add coincident constraints"))
         self.play(constraint.Coincident(self._line.start, self._left))
         self.play(constraint.Coincident(self._line.end, self._right))
 
-        self.play(title.next("Add tangent constraints"))
+        self.play(self._title.next("Add tangent constraints"))
         self.play(constraint.Tangent(self._line, self._left, rotate=True))
         self.play(
             constraint.Tangent(self._line, self._right, rotate=True, reverse=True)